@@ -0,0 +1,103 @@
+"""Per-page PDF parsing, kept in its own module so process pool workers can import it by name"""
+import pickle
+import tempfile
+import pdfplumber
+import pymupdf
+import pandas as pd
+
+def build_page_content(text, tables, page_num):
+    """Turn a page's raw text and table rows into separate lists of text and table items"""
+    text_items = []
+    table_items = []
+    
+    if text.strip():
+        text_items.append({
+            "content": text,
+            "page": page_num + 1,
+            "type": "text"
+        })
+    
+    for table_num, table in enumerate(tables):
+        if table:
+            df = pd.DataFrame(table)
+            
+            if not df.empty:
+                headers = []
+                if len(df.columns) > 0:
+                    first_row = df.iloc[0].tolist()
+                    # Stops at the first non-null cell (None and NaN both count as null)
+                    if any(x is not None and not (isinstance(x, float) and x != x) for x in first_row):
+                        headers = [str(h).strip() if h is not None else f"Column_{i}" 
+                                  for i, h in enumerate(first_row)]
+                        df = df.iloc[1:]
+                    else:
+                        headers = [f"Column_{i}" for i in range(len(df.columns))]
+                
+                unique_headers = []
+                header_counts = {}
+                
+                for h in headers:
+                    if h in header_counts:
+                        header_counts[h] += 1
+                        unique_headers.append(f"{h}_{header_counts[h]}")
+                    else:
+                        header_counts[h] = 0
+                        unique_headers.append(h)
+                
+                df.columns = unique_headers
+            
+            table_items.append({
+                "page": page_num + 1,
+                "type": "table",
+                "table_number": table_num + 1,
+                "dataframe": df
+            })
+    
+    return text_items, table_items
+
+def spill_items(items):
+    """Pickle items to a temp file and return its path, or None when there is nothing to write"""
+    if not items:
+        return None
+    with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as tmp:
+        pickle.dump(items, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+    return tmp.name
+
+def parse_page_chunk(file_path, start, stop):
+    """Extract pages [start, stop) of the PDF and spill their text and table items (may run in a worker process)"""
+    chunk_text_items = []
+    chunk_table_items = []
+    fallback_pdf = None
+    
+    try:
+        with pymupdf.open(file_path) as doc:
+            for page_num in range(start, stop):
+                page = doc[page_num]
+                text = page.get_text("text")
+                
+                tables = []
+                
+                # Both table finders look for ruling lines, so a page without vector drawings
+                # cannot yield a table and is not worth searching
+                if page.get_drawings():
+                    tables = [table.extract() for table in page.find_tables().tables]
+                    
+                    # pdfplumber's table finder still catches some ruled layouts MuPDF misses
+                    if not tables:
+                        if fallback_pdf is None:
+                            fallback_pdf = pdfplumber.open(file_path, pages=list(range(start + 1, stop + 1)))
+                        fallback_page = fallback_pdf.pages[page_num - start]
+                        tables = fallback_page.extract_tables()
+                        # Drop pdfplumber's cached layout objects as soon as the page is done
+                        fallback_page.close()
+                
+                page_text_items, page_table_items = build_page_content(text, tables, page_num)
+                chunk_text_items.extend(page_text_items)
+                chunk_table_items.extend(page_table_items)
+    finally:
+        if fallback_pdf is not None:
+            fallback_pdf.close()
+    
+    # Spill here so DataFrames never cross the process boundary; only paths and counts go back
+    return (spill_items(chunk_text_items), spill_items(chunk_table_items),
+            len(chunk_text_items), len(chunk_table_items))
@@ -1,159 +1,286 @@
 import streamlit as st
-import pdfplumber
-import pandas as pd
+import pymupdf
 import docx
 import io
 import os
+import multiprocessing
+import threading
+import re
+import pickle
+import tempfile
+import weakref
+from xml.sax.saxutils import escape
 import zipfile
-import openpyxl
-from concurrent.futures import ThreadPoolExecutor
+import xlsxwriter
+from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import time
+from page_parsing import parse_page_chunk
 
-def extract_tables_from_pdf(file_path):
-    document_content = []
+PARALLEL_PAGE_THRESHOLD = 8
+PAGE_CHUNK_SIZE = 50
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+class SpilledDocumentContent:
+    """Extracted document content kept on disk in page chunks, split by type and loaded back lazily"""
     
-    with pdfplumber.open(file_path) as pdf:
-        for page_num, page in enumerate(pdf.pages):
-            text = page.extract_text() or ""
-            if text.strip():
-                document_content.append({
-                    "content": text,
-                    "page": page_num + 1,
-                    "type": "text"
-                })
-            
-            tables = page.extract_tables()
-            for table_num, table in enumerate(tables):
-                if table:
-                    df = pd.DataFrame(table)
-                    
-                    if not df.empty:
-                        headers = []
-                        if len(df.columns) > 0:
-                            if not pd.isna(df.iloc[0]).all() and not all(x is None for x in df.iloc[0]):
-                                headers = [str(h).strip() if h is not None else f"Column_{i}" 
-                                          for i, h in enumerate(df.iloc[0])]
-                                df = df.iloc[1:]
-                            else:
-                                headers = [f"Column_{i}" for i in range(len(df.columns))]
-                        
-                        unique_headers = []
-                        header_counts = {}
-                        
-                        for h in headers:
-                            if h in header_counts:
-                                header_counts[h] += 1
-                                unique_headers.append(f"{h}_{header_counts[h]}")
-                            else:
-                                header_counts[h] = 0
-                                unique_headers.append(h)
-                        
-                        df.columns = unique_headers
-                    
-                    document_content.append({
-                        "page": page_num + 1,
-                        "type": "table",
-                        "table_number": table_num + 1,
-                        "dataframe": df
-                    })
+    def __init__(self):
+        self._text_paths = []
+        self._table_paths = []
+        self._spill_paths = []
+        self.text_count = 0
+        self.table_count = 0
+        self._finalizer = weakref.finalize(self, _remove_files, self._spill_paths)
     
-    return document_content
+    def append_chunk(self, text_path, table_path, text_count, table_count):
+        # Text and tables are spilled separately so each consumer only unpickles the kind it needs.
+        # Either path is None when the chunk had no items of that kind.
+        for path, paths in ((text_path, self._text_paths), (table_path, self._table_paths)):
+            if path is not None:
+                paths.append(path)
+                self._spill_paths.append(path)
+        self.text_count += text_count
+        self.table_count += table_count
+    
+    def _iter_spilled(self, paths):
+        for path in paths:
+            with open(path, "rb") as f:
+                yield from pickle.load(f)
+    
+    def iter_text_items(self):
+        return self._iter_spilled(self._text_paths)
+    
+    def iter_table_items(self):
+        return self._iter_spilled(self._table_paths)
+    
+    def __len__(self):
+        return self.text_count + self.table_count
+    
+    @property
+    def chunk_paths(self):
+        return tuple(self._spill_paths)
 
-def process_single_pdf(uploaded_file, temp_dir):
-    """Process a single PDF file and return its content and metadata"""
-    file_path = f"{temp_dir}/{uploaded_file.name}"
+# Spill file paths are unique per extraction, so they identify the content without reading it back
+CONTENT_HASH_FUNCS = {SpilledDocumentContent: lambda content: content.chunk_paths}
+
+@st.cache_resource(show_spinner=False)
+def get_page_pool():
+    """One process pool shared by every file and session, so page parsing never runs more than cpu_count workers"""
+    # Spawn rather than fork: forking the multi-threaded Streamlit server can deadlock the child
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context("spawn"))
+
+@st.cache_resource(show_spinner=False)
+def get_page_pool_lock():
+    """Serialises replacing a broken page pool across file threads"""
+    return threading.Lock()
+
+def _discard_page_pool(pool):
+    """Shut down a broken pool and drop it from the cache, unless another thread already replaced it"""
+    pool.shutdown(wait=False, cancel_futures=True)
+    with get_page_pool_lock():
+        if get_page_pool() is pool:
+            get_page_pool.clear()
+
+def _extract_document_content(file_path):
+    with pymupdf.open(file_path) as doc:
+        page_count = doc.page_count
+    
+    document_content = SpilledDocumentContent()
+    
+    # Small documents are not worth the round trip through the process pool
+    if page_count < PARALLEL_PAGE_THRESHOLD:
+        document_content.append_chunk(*parse_page_chunk(file_path, 0, page_count))
+        return document_content
+    
+    # Spread pages across workers, but never hold more than PAGE_CHUNK_SIZE pages in one chunk
+    max_workers = os.cpu_count() or 1
+    chunk_size = max(1, min(PAGE_CHUNK_SIZE, -(-page_count // max_workers)))
+    starts = list(range(0, page_count, chunk_size))
+    stops = [min(start + chunk_size, page_count) for start in starts]
+    
+    pool = get_page_pool()
+    futures = []
+    added = 0
     
     try:
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        # submit() itself raises BrokenProcessPool once the pool is broken, so it belongs inside the try
+        for start, stop in zip(starts, stops):
+            futures.append(pool.submit(parse_page_chunk, file_path, start, stop))
         
-        document_content = extract_tables_from_pdf(file_path)
-        
-        text_count = sum(1 for item in document_content if item["type"] == "text")
-        table_count = sum(1 for item in document_content if item["type"] == "table")
+        # Workers spill their own chunks, so results waiting for an earlier page are only file paths
+        for future in futures:
+            document_content.append_chunk(*future.result())
+            added += 1
+    except BaseException as exc:
+        # Remove the spill files of chunks that were never handed to document_content
+        for future in futures[added:]:
+            if not future.cancel() and future.exception() is None:
+                text_path, table_path, _, _ = future.result()
+                _remove_files([path for path in (text_path, table_path) if path is not None])
+        if isinstance(exc, BrokenProcessPool):
+            # A worker died (e.g. killed for memory); start a fresh pool for the next extraction
+            _discard_page_pool(pool)
+        raise
+    
+    return document_content
+
+# Cached as a resource rather than data: the result owns its spill files and must not be copied
+@st.cache_resource(max_entries=32, show_spinner=False)
+def extract_tables_from_pdf(file_bytes):
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        tmp.write(file_bytes)
+    
+    try:
+        return _extract_document_content(tmp.name)
+    finally:
+        _remove_files([tmp.name])
+
+def process_single_pdf(filename, file_bytes):
+    """Process a single PDF file and return its content and metadata"""
+    try:
+        document_content = extract_tables_from_pdf(file_bytes)
         
         return {
-            "filename": uploaded_file.name,
+            "filename": filename,
             "content": document_content,
-            "text_count": text_count,
-            "table_count": table_count,
+            "text_count": document_content.text_count,
+            "table_count": document_content.table_count,
             "success": True,
             "error": None
         }
     
     except Exception as e:
         return {
-            "filename": uploaded_file.name,
+            "filename": filename,
             "content": [],
             "text_count": 0,
             "table_count": 0,
             "success": False,
             "error": str(e)
         }
+
+def _load_docx_template():
+    """Read python-docx's default template once, splitting document.xml around the point where body content goes"""
+    template_path = os.path.join(os.path.dirname(docx.__file__), "templates", "default.docx")
+    with zipfile.ZipFile(template_path) as template:
+        parts = {name: template.read(name) for name in template.namelist()}
     
-    finally:
-        try:
-            os.remove(file_path)
-        except:
-            pass
+    document_xml = parts.pop("word/document.xml").decode("utf-8")
+    body_end = document_xml.index("<w:sectPr")
+    return parts, document_xml[:body_end], document_xml[body_end:]
+
+DOCX_TEMPLATE_PARTS, DOCX_BODY_START, DOCX_BODY_END = _load_docx_template()
+INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
 
+def _docx_paragraph(text, style=None):
+    """Render one WordprocessingML paragraph, turning newlines and tabs into breaks the way python-docx does"""
+    text = escape(INVALID_XML_CHARS.sub("", text.replace("\r\n", "\n").replace("\r", "\n")))
+    text = text.replace("\t", '</w:t><w:tab/><w:t xml:space="preserve">')
+    text = text.replace("\n", '</w:t><w:br/><w:t xml:space="preserve">')
+    style_xml = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f'<w:p>{style_xml}<w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+@st.cache_resource(max_entries=64, show_spinner=False, hash_funcs=CONTENT_HASH_FUNCS)
 def create_word_document_text_only(document_content, filename):
-    doc = docx.Document()
-    doc.add_heading(f'PDF Text Content - {filename}', 0)
+    paragraphs = [_docx_paragraph(f'PDF Text Content - {filename}', "Title")]
     
-    text_content = [item for item in document_content if item["type"] == "text"]
+    # Spilled chunks are loaded one at a time
+    for item in document_content.iter_text_items():
+        paragraphs.append(_docx_paragraph(f'Page {item["page"]}', "Heading1"))
+        paragraphs.append(_docx_paragraph(item["content"]))
     
-    for item in text_content:
-        doc.add_heading(f'Page {item["page"]}', level=1)
-        doc.add_paragraph(item["content"])
+    document_xml = DOCX_BODY_START + "".join(paragraphs) + DOCX_BODY_END
     
+    # Write the package directly rather than building and serialising a python-docx DOM.
+    # A fast deflate keeps the files small without the cost of the default level.
     docx_io = io.BytesIO()
-    doc.save(docx_io)
-    docx_io.seek(0)
+    with zipfile.ZipFile(docx_io, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as docx_zip:
+        for name, data in DOCX_TEMPLATE_PARTS.items():
+            docx_zip.writestr(name, data)
+        docx_zip.writestr("word/document.xml", document_xml.encode("utf-8"))
     
-    return docx_io
+    return docx_io.getvalue()
 
+@st.cache_resource(max_entries=64, show_spinner=False, hash_funcs=CONTENT_HASH_FUNCS)
 def create_excel_tables(document_content, filename):
-    table_content = [item for item in document_content if item["type"] == "table"]
-    
     excel_io = io.BytesIO()
+    used_sheet_names = set()
+    name_counters = {}
     
-    with pd.ExcelWriter(excel_io, engine='openpyxl') as writer:
-        for item in table_content:
+    # constant_memory flushes each row to disk as soon as the next one starts, so rows must be written in order.
+    # df.to_excel writes column by column, which would silently drop cells in this mode.
+    workbook_options = {'constant_memory': True, 'use_zip64': True, 'strings_to_urls': False}
+    with xlsxwriter.Workbook(excel_io, workbook_options) as workbook:
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        
+        for item in document_content.iter_table_items():
             df = item["dataframe"]
             sheet_name = f"Page{item['page']}_Table{item['table_number']}"
-            if len(sheet_name) > 31:
-                sheet_name = sheet_name[:31]
             
+            # (page, table_number) pairs are unique and every truncated or suffixed name is exactly
+            # 31 characters long, so only names that reach Excel's limit can ever clash
+            if len(sheet_name) >= 31:
+                base_sheet_name = sheet_name[:31]
+                sheet_name = base_sheet_name
+                
+                # Resume numbering from the last suffix used for this name instead of rescanning from 1
+                while sheet_name in used_sheet_names:
+                    name_counters[base_sheet_name] = name_counters.get(base_sheet_name, 0) + 1
+                    suffix = f"_{name_counters[base_sheet_name]}"
+                    sheet_name = f"{base_sheet_name[:31 - len(suffix)]}{suffix}"
+                used_sheet_names.add(sheet_name)
+            
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, df.columns.tolist(), header_format)
+            # Blank out missing cells as to_excel did; xlsxwriter rejects NaN values
+            rows = df.astype(object).where(df.notna(), None)
+            for row_num, row in enumerate(rows.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row_num, 0, row)
+    
+    return excel_io.getvalue()
+
+def generate_output_files(all_results):
+    """Build the Word and Excel bytes for every processed file once, keyed by its index in all_results"""
+    generated_files = {}
+    used_base_names = set()
+    
+    for index, result in enumerate(all_results):
+        if result["success"] and result["content"]:
+            # Uploads can share a filename, so number repeats to keep output names apart
+            base_filename = result["filename"].split('.')[0]
+            unique_name = base_filename
             counter = 1
-            base_sheet_name = sheet_name
-            while sheet_name in writer.sheets:
-                truncate_length = min(len(base_sheet_name) - len(str(counter)) - 1, 30)
-                sheet_name = f"{base_sheet_name[:truncate_length]}_{counter}"
+            while unique_name in used_base_names:
                 counter += 1
+                unique_name = f"{base_filename}_{counter}"
+            used_base_names.add(unique_name)
             
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
+            word_doc = create_word_document_text_only(result["content"], result["filename"])
+            excel_file = None
+            if result["table_count"] > 0:
+                excel_file = create_excel_tables(result["content"], result["filename"])
+            generated_files[index] = (unique_name, word_doc, excel_file)
     
-    excel_io.seek(0)
-    return excel_io
+    return generated_files
 
-def create_combined_zip_archive(all_results):
+def create_combined_zip_archive(all_results, generated_files, compression_level=1):
     """Create a ZIP archive containing all processed files"""
     zip_buffer = io.BytesIO()
     
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for result in all_results:
-            if result["success"] and result["content"]:
-                base_filename = result["filename"].split('.')[0]
-                
-                # Add Word document
-                word_doc = create_word_document_text_only(result["content"], result["filename"])
-                zip_file.writestr(f"{base_filename}_text.docx", word_doc.getvalue())
-                
-                # Add Excel file if there are tables
-                if result["table_count"] > 0:
-                    excel_file = create_excel_tables(result["content"], result["filename"])
-                    zip_file.writestr(f"{base_filename}_tables.xlsx", excel_file.getvalue())
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level) as zip_file:
+        for base_filename, word_doc, excel_file in generated_files.values():
+            # DOCX/XLSX files are already deflated ZIPs, so store them as-is instead of compressing twice
+            zip_file.writestr(f"{base_filename}_text.docx", word_doc, compress_type=zipfile.ZIP_STORED)
+            
+            # Add Excel file if there are tables
+            if excel_file is not None:
+                zip_file.writestr(f"{base_filename}_tables.xlsx", excel_file, compress_type=zipfile.ZIP_STORED)
         
         # Create summary report
         summary_doc = docx.Document()
@@ -177,134 +304,135 @@ def create_combined_zip_archive(all_results):
     zip_buffer.seek(0)
     return zip_buffer
 
-st.title("Multi-File PDF Extractor")
-st.markdown("Upload multiple PDF files to extract text and tables from all of them at once.")
+# Spawned page-parsing workers import this file as __mp_main__; keep the UI out of them
+if __name__ == "__main__":
+    st.title("Multi-File PDF Extractor")
+    st.markdown("Upload multiple PDF files to extract text and tables from all of them at once.")
 
-# File uploader that accepts multiple files
-uploaded_files = st.file_uploader(
-    "Upload PDF files", 
-    type="pdf", 
-    accept_multiple_files=True,
-    help="You can select multiple PDF files at once"
-)
+    # File uploader that accepts multiple files
+    uploaded_files = st.file_uploader(
+        "Upload PDF files", 
+        type="pdf", 
+        accept_multiple_files=True,
+        help="You can select multiple PDF files at once"
+    )
 
-if uploaded_files:
-    st.info(f"📁 {len(uploaded_files)} file(s) uploaded")
-    
-    # Create temporary directory
-    temp_dir = 'temp_pdfs'
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    # Process files
-    if st.button("Process All Files", type="primary"):
-        # Initialize progress tracking
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        all_results = []
+    if uploaded_files:
+        st.info(f"📁 {len(uploaded_files)} file(s) uploaded")
         
-        # Process files sequentially with progress updates
-        for i, uploaded_file in enumerate(uploaded_files):
-            status_text.text(f"Processing {uploaded_file.name}...")
+        # Process files
+        if st.button("Process All Files", type="primary"):
+            # Initialize progress tracking
+            progress_bar = st.progress(0)
+            status_text = st.empty()
             
-            result = process_single_pdf(uploaded_file, temp_dir)
-            all_results.append(result)
+            results_by_index = {}
+            status_text.text(f"Processing {len(uploaded_files)} file(s)...")
             
-            # Update progress
-            progress_bar.progress((i + 1) / len(uploaded_files))
-        
-        status_text.text("Processing complete!")
-        
-        st.subheader("Processing Results")
-        
-        successful_files = [r for r in all_results if r["success"]]
-        failed_files = [r for r in all_results if not r["success"]]
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Files", len(uploaded_files))
-        with col2:
-            st.metric("Successful", len(successful_files), delta=None)
-        with col3:
-            st.metric("Failed", len(failed_files), delta=None if len(failed_files) == 0 else f"-{len(failed_files)}")
-        
-        for result in all_results:
-            with st.expander(f"📄 {result['filename']}" + ("" if result["success"] else " ❌")):
-                if result["success"]:
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**Text sections:** {result['text_count']}")
-                    with col2:
-                        st.write(f"**Tables:** {result['table_count']}")
-                    
-                    if result["content"]:
-                        text_items = [item for item in result["content"] if item["type"] == "text"]
-                        if text_items:
-                            st.write("**Text Preview:**")
-                            preview_text = text_items[0]["content"][:200] + ("..." if len(text_items[0]["content"]) > 200 else "")
-                            st.text(preview_text)
+            # Read uploads up front so worker threads never touch Streamlit's UploadedFile objects.
+            # getvalue() hands back the upload's own bytes object, whereas bytes(getbuffer()) would copy it.
+            pending = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+            
+            # Process files in parallel, updating progress as each one finishes
+            max_workers = min(os.cpu_count() or 1, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(process_single_pdf, name, file_bytes): i
+                    for i, (name, file_bytes) in enumerate(pending)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    result = future.result()
+                    results_by_index[futures[future]] = result
+                    status_text.text(f"Processed {result['filename']}")
+                    progress_bar.progress(done / len(pending))
+            
+            # Keep results in upload order regardless of completion order
+            all_results = [results_by_index[i] for i in range(len(pending))]
+            
+            status_text.text("Processing complete!")
+            
+            st.subheader("Processing Results")
+            
+            successful_files = [r for r in all_results if r["success"]]
+            failed_files = [r for r in all_results if not r["success"]]
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Files", len(uploaded_files))
+            with col2:
+                st.metric("Successful", len(successful_files), delta=None)
+            with col3:
+                st.metric("Failed", len(failed_files), delta=None if len(failed_files) == 0 else f"-{len(failed_files)}")
+            
+            for result in all_results:
+                with st.expander(f"📄 {result['filename']}" + ("" if result["success"] else " ❌")):
+                    if result["success"]:
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.write(f"**Text sections:** {result['text_count']}")
+                        with col2:
+                            st.write(f"**Tables:** {result['table_count']}")
                         
-                        table_items = [item for item in result["content"] if item["type"] == "table"]
-                        if table_items:
-                            st.write("**First Table Preview:**")
-                            df = table_items[0]["dataframe"]
-                            if not df.empty:
-                                st.dataframe(df.head(3))
-                else:
-                    st.error(f"Error: {result['error']}")
-        
-        # Download options
-        if successful_files:
-            st.subheader("Download Options")
+                        if result["content"]:
+                            # Only the first spilled chunk of each kind is loaded back
+                            first_text = next(result["content"].iter_text_items(), None)
+                            if first_text:
+                                st.write("**Text Preview:**")
+                                preview_text = first_text["content"][:200] + ("..." if len(first_text["content"]) > 200 else "")
+                                st.text(preview_text)
+                            
+                            first_table = next(result["content"].iter_table_items(), None)
+                            if first_table:
+                                st.write("**First Table Preview:**")
+                                df = first_table["dataframe"]
+                                if not df.empty:
+                                    st.dataframe(df.head(3))
+                    else:
+                        st.error(f"Error: {result['error']}")
             
-            # Individual file downloads
-            st.write("**Individual Downloads:**")
-            for result in successful_files:
-                if result["content"]:
-                    base_filename = result["filename"].split('.')[0]
-                    
+            # Download options
+            if successful_files:
+                st.subheader("Download Options")
+                
+                # Build each file once and reuse the bytes for both individual and combined downloads
+                generated_files = generate_output_files(all_results)
+                
+                # Individual file downloads
+                st.write("**Individual Downloads:**")
+                for index, (base_filename, word_doc, excel_file) in generated_files.items():
                     col1, col2 = st.columns(2)
                     
                     with col1:
-                        word_doc = create_word_document_text_only(result["content"], result["filename"])
                         st.download_button(
                             label=f"📄 {base_filename} - Text",
                             data=word_doc,
                             file_name=f"{base_filename}_text.docx",
                             mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            key=f"word_{base_filename}"
+                            key=f"word_{index}"
                         )
                     
                     with col2:
-                        if result["table_count"] > 0:
-                            excel_file = create_excel_tables(result["content"], result["filename"])
+                        if excel_file is not None:
                             st.download_button(
                                 label=f"📊 {base_filename} - Tables",
                                 data=excel_file,
                                 file_name=f"{base_filename}_tables.xlsx",
                                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                key=f"excel_{base_filename}"
+                                key=f"excel_{index}"
                             )
                         else:
                             st.write("*No tables found*")
-            
-            # Combined download
-            st.write("**Combined Download:**")
-            zip_buffer = create_combined_zip_archive(all_results)
-            st.download_button(
-                label="📦 Download All Files (ZIP)",
-                data=zip_buffer,
-                file_name="pdf_extraction_results.zip",
-                mime="application/zip",
-                help="Downloads all processed files plus a summary report"
-            )
-
-else:
-    st.info("👆 Please upload one or more PDF files to get started")
+                
+                # Combined download
+                st.write("**Combined Download:**")
+                zip_buffer = create_combined_zip_archive(all_results, generated_files)
+                st.download_button(
+                    label="📦 Download All Files (ZIP)",
+                    data=zip_buffer,
+                    file_name="pdf_extraction_results.zip",
+                    mime="application/zip",
+                    help="Downloads all processed files plus a summary report"
+                )
 
-try:
-    if os.path.exists('temp_pdfs'):
-        for file in os.listdir('temp_pdfs'):
-            os.remove(os.path.join('temp_pdfs', file))
-except:
-    pass
+    else:
+        st.info("👆 Please upload one or more PDF files to get started")